@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Shared GitHub API helpers for the issue-management scripts.
+
+The auth token is resolved once via `gh auth token` on the first API call
+and every request goes through a single pooled connection (httpx with
+HTTP/2 when installed, stdlib urllib otherwise), so importing scripts never
+pay a gh fork/exec or a fresh TLS handshake per call — and scripts that
+import only a helper class pay nothing at all.
+"""
+import asyncio
+import subprocess
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 20   # createIssue aliases per GraphQL document
+MAX_WORKERS = 6   # capped to stay under GitHub's secondary rate limit
+
+# Exponential backoff for transient failures and secondary rate limits,
+# honouring GitHub's Retry-After header when it is present.
+RETRY_STATUSES = {429, 403, 500, 502, 503, 504}
+MAX_RETRIES = 6
+
+try:
+    # orjson (de)serializes the large issue-body payloads 2-3x faster when
+    # installed; everything falls back to stdlib json without it.
+    import orjson
+    _loads = orjson.loads
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Auth and the pooled client are initialized lazily on the first API call,
+# so importing this module (e.g. for RateLimiter alone) doesn't fork gh or
+# open a connection that is never used.
+_headers = None
+_session = None
+_session_ready = False
+
+def api_headers():
+    """Resolve the gh auth token on first use; returns the shared headers."""
+    global _headers
+    if _headers is None:
+        token = subprocess.check_output(["gh", "auth", "token"], text=True).strip()
+        _headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+        }
+    return _headers
+
+def _get_session():
+    """Create the pooled httpx client on first use (None without httpx)."""
+    global _session, _session_ready
+    if not _session_ready:
+        _session_ready = True
+        try:
+            import httpx
+            _session = httpx.Client(http2=True, base_url="https://api.github.com",
+                                    headers=api_headers())
+        except ImportError:
+            _session = None
+    return _session
+
+class RateLimiter:
+    """Gate outbound requests on GitHub's rate-limit headers.
+
+    Workers call acquire() before each request and update(headers) after.
+    Once the advertised remaining quota drops below the threshold — or a
+    secondary-limit penalty is in force — acquire() blocks every worker
+    until the reset time passes, so a thread fan-out can't burst into the
+    abuse limiter and trigger 403 cascades.
+    """
+
+    def __init__(self, threshold=100):
+        self._lock = threading.Lock()
+        self._threshold = threshold
+        self._remaining = None
+        self._reset = 0.0
+        self._backoff_until = 0.0
+        self._waiting = 0
+
+    def _wait_time(self):
+        now = time.time()
+        if now < self._backoff_until:
+            return self._backoff_until - now
+        if (self._remaining is not None and self._remaining <= self._threshold
+                and now < self._reset):
+            return self._reset - now
+        return 0.0
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                wait = self._wait_time()
+                if not wait:
+                    return
+                self._waiting += 1
+            # Re-check periodically so an update() that clears the backoff
+            # releases waiters early.
+            time.sleep(min(wait, 5.0))
+            with self._lock:
+                self._waiting -= 1
+
+    def update(self, headers, penalty=0.0):
+        """Record a response's rate-limit headers; penalty adds a pause."""
+        with self._lock:
+            try:
+                self._remaining = int(headers.get("X-RateLimit-Remaining", ""))
+                self._reset = float(headers.get("X-RateLimit-Reset", ""))
+            except ValueError:
+                pass
+            if penalty:
+                self._backoff_until = max(self._backoff_until, time.time() + penalty)
+
+    def get_queue_status(self):
+        """Snapshot (waiting workers, remaining quota, seconds blocked)."""
+        with self._lock:
+            return self._waiting, self._remaining, self._wait_time()
+
+async def api_request(client, method, url, **kwargs):
+    """Issue one request on an async client, backing off and retrying on
+    transient failures."""
+    for attempt in range(MAX_RETRIES):
+        resp = await client.request(method, url, **kwargs)
+        if resp.status_code not in RETRY_STATUSES:
+            break
+        wait = float(resp.headers.get("Retry-After", 1.5 * 2 ** attempt))
+        print(f"⏳ HTTP {resp.status_code}; retrying in {wait:.0f}s")
+        await asyncio.sleep(wait)
+    return resp
+
+def _parse_body(text):
+    """Parse a response body as JSON, falling back to the raw text.
+
+    Error responses from proxies or GitHub's edge (502/503 pages) are often
+    HTML; returning the text lets graphql() report "HTTP {status}" with a
+    snippet instead of dying on a JSONDecodeError.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+def api_post(path, payload):
+    """POST JSON to api.github.com; returns (status, parsed body).
+
+    The payload is serialized to UTF-8 bytes exactly once here and handed to
+    the transport pre-encoded, so multi-KB issue bodies aren't re-serialized
+    by the client layer on top.
+    """
+    body = json.dumps(payload).encode()
+    session = _get_session()
+    if session is not None:
+        resp = session.post(path, content=body)
+        return resp.status_code, _parse_body(resp.text)
+    req = urllib.request.Request(
+        f"https://api.github.com{path}",
+        data=body,
+        headers=api_headers(),
+    )
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, _parse_body(resp.read().decode())
+    except urllib.error.HTTPError as e:
+        return e.code, _parse_body(e.read().decode(errors="replace"))
+
+def graphql(query):
+    """POST a GraphQL document; returns (data, error)."""
+    status, payload = api_post("/graphql", {"query": query})
+    if status != 200:
+        return None, f"HTTP {status}: {str(payload)[:80]}"
+    if payload.get("errors"):
+        return None, payload["errors"][0].get("message", "unknown GraphQL error")
+    return payload["data"], None
+
+ISSUE_PAGE_FIELDS = """
+          pageInfo { hasNextPage endCursor }
+          nodes { number title }
+"""
+
+def fetch_repo_metadata(owner, name):
+    """Fetch repository ID, label and milestone node IDs in one introspection
+    query; returns (metadata dict, error).
+
+    The issue connection is paginated via pageInfo/endCursor — each full run
+    creates ~45 issues, so first: 100 alone would quickly stop seeing older
+    titles and the duplicate-skip check would start recreating them.
+    """
+    query = f"""
+    query {{
+      repository(owner: "{owner}", name: "{name}") {{
+        id
+        labels(first: 100) {{ nodes {{ id name }} }}
+        milestones(first: 100, states: [OPEN, CLOSED]) {{
+          nodes {{ id number title }}
+        }}
+        issues(first: 100, states: [OPEN, CLOSED]) {{{ISSUE_PAGE_FIELDS}}}
+      }}
+    }}
+    """
+    data, err = graphql(query)
+    if err:
+        return None, err
+    repo = data["repository"]
+
+    issues = list(repo["issues"]["nodes"])
+    page = repo["issues"]["pageInfo"]
+    while page["hasNextPage"]:
+        data, err = graphql(f"""
+        query {{
+          repository(owner: "{owner}", name: "{name}") {{
+            issues(first: 100, states: [OPEN, CLOSED],
+                   after: {json.dumps(page["endCursor"])}) {{{ISSUE_PAGE_FIELDS}}}
+          }}
+        }}
+        """)
+        if err:
+            return None, err
+        connection = data["repository"]["issues"]
+        issues.extend(connection["nodes"])
+        page = connection["pageInfo"]
+
+    return {
+        "id": repo["id"],
+        "label_ids": {l["name"]: l["id"] for l in repo["labels"]["nodes"]},
+        "milestone_ids": {m["number"]: m["id"] for m in repo["milestones"]["nodes"]},
+        "milestone_by_title": {m["title"]: m["number"] for m in repo["milestones"]["nodes"]},
+        "issue_by_title": {i["title"]: i["number"] for i in issues},
+    }, None
+
+def ensure_labels(meta, issues, on_error):
+    """Create any labels referenced by queued issues that don't exist yet.
+
+    Previously unknown labels were silently dropped (the old per-label
+    `gh issue edit` calls discarded their errors). All missing labels are
+    created in one batched createLabel mutation and meta is updated in place.
+    """
+    wanted = {l for issue in issues for l in issue.get("labels", [])}
+    missing = sorted(wanted - set(meta["label_ids"]))
+    if not missing:
+        return
+    fields = [
+        f'l{i}: createLabel(input: {{repositoryId: {json.dumps(meta["id"])}, '
+        f'name: {json.dumps(name)}, color: "ededed"}}) {{ label {{ id name }} }}'
+        for i, name in enumerate(missing)
+    ]
+    data, err = graphql("mutation {\n" + "\n".join(fields) + "\n}")
+    if err:
+        on_error(f"could not create labels {missing}: {err}")
+        return
+    for result in data.values():
+        label = result["label"]
+        meta["label_ids"][label["name"]] = label["id"]
+
+def _submit_chunk(meta, chunk, on_error):
+    """Create one chunk of issues via a multi-mutation GraphQL document."""
+    fields = []
+    alias_to_index = {}
+    for i, issue in chunk:
+        alias = issue.get("alias") or f"i{i}"
+        alias_to_index[alias] = i
+        inputs = [
+            f'repositoryId: {json.dumps(meta["id"])}',
+            f'title: {json.dumps(issue["title"])}',
+            f'body: {json.dumps(issue["body"])}',
+        ]
+        ids = [meta["label_ids"][l] for l in issue.get("labels", [])
+               if l in meta["label_ids"]]
+        if ids:
+            inputs.append(f'labelIds: {json.dumps(ids)}')
+        milestone_id = meta["milestone_ids"].get(issue.get("milestone"))
+        if milestone_id:
+            inputs.append(f'milestoneId: {json.dumps(milestone_id)}')
+        fields.append(
+            f'{alias}: createIssue(input: {{{", ".join(inputs)}}}) '
+            '{ issue { number } }'
+        )
+    mutation = "mutation {\n" + "\n".join(fields) + "\n}"
+
+    data, err = graphql(mutation)
+    if err:
+        on_error(err)
+        return {}
+
+    # One pass over the bulk response rather than a keyed lookup per issue.
+    return {
+        alias_to_index[alias]: result["issue"]["number"]
+        for alias, result in data.items()
+    }
+
+def submit_issues(meta, issues, on_created, on_error):
+    """Create all queued issues, fanning 20-alias chunks out across a thread
+    pool. Invokes on_created(num, issue) per created issue in queue order.
+
+    Issues whose title already exists in the repo are skipped (reporting the
+    existing number), so a partially failed run can be retried without
+    creating duplicates.
+    """
+    ensure_labels(meta, issues, on_error)
+
+    existing = meta.get("issue_by_title", {})
+    numbers = {}
+    indexed = []
+    for i, issue in enumerate(issues):
+        if issue["title"] in existing:
+            numbers[i] = existing[issue["title"]]
+        else:
+            indexed.append((i, issue))
+    chunks = [indexed[i:i + CHUNK_SIZE] for i in range(0, len(indexed), CHUNK_SIZE)]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for result in ex.map(lambda c: _submit_chunk(meta, c, on_error), chunks):
+            numbers.update(result)
+
+    for i, issue in enumerate(issues):
+        if i in numbers:
+            on_created(numbers[i], issue)
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Run epic and issue creation as a single process.
+
+Epics must exist before the phase issues are filed, so the normal flow is
+create_epics.py followed by create_github_issues.py. Running both through
+this entrypoint shares one interpreter, one `gh auth token` lookup and one
+connection pool instead of paying that startup cost twice.
+"""
+from create_epics import main as create_epics_main
+from create_github_issues import main as create_issues_main
+
+def main():
+    create_epics_main()
+    create_issues_main()
+
+if __name__ == "__main__":
+    main()
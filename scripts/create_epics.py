@@ -1,42 +1,10 @@
 #!/usr/bin/env python3
-import subprocess
-import json
+from _gh import fetch_repo_metadata, submit_issues
 
 REPO = "goblinsan/vizail"
+OWNER, NAME = REPO.split("/")
 
-def create_epic(title, body, *labels):
-    result = subprocess.run(
-        ["gh", "api", "-X", "POST", f"/repos/{REPO}/issues",
-         "-f", f"title={title}",
-         "-f", f"body={body}"],
-        capture_output=True,
-        text=True
-    )
-    
-    if result.returncode != 0:
-        print(f"  ❌ {title}: {result.stderr[:80]}")
-        return None
-    
-    try:
-        data = json.loads(result.stdout)
-        num = data.get("number")
-        print(f"  ✅ Epic #{num}: {title[:40]}")
-        
-        # Add labels
-        for label in labels:
-            subprocess.run(["gh", "issue", "edit", str(num), "--add-label", label],
-                          capture_output=True)
-        return num
-    except Exception as e:
-        print(f"  ❌ Parse error: {e}")
-        return None
-
-print("Creating Epic Issues...\n")
-
-epics = {
-    0: create_epic(
-        "🎯 Epic: Phase 0 - Prep & Hardening",
-        """# Phase 0: Prep & Hardening
+PHASE0_BODY = """# Phase 0: Prep & Hardening
 
 **Goal:** Stabilize codebase, improve type safety, add telemetry, prepare for cloud migration.
 
@@ -54,13 +22,9 @@ epics = {
 - App gracefully handles corrupt localStorage
 - LayoutSpec has version field with migration path
 - 80%+ test coverage on commands/, persistence.ts
-""",
-        "epic", "phase-0"
-    ),
-    
-    1: create_epic(
-        "🎯 Epic: Phase 1 - Cloud Persistence & Sharing",
-        """# Phase 1: Cloud Persistence + Sharing
+"""
+
+PHASE1_BODY = """# Phase 1: Cloud Persistence + Sharing
 
 **Goal:** Replace localStorage with cloud storage, enable canvas sharing with basic roles.
 
@@ -81,13 +45,9 @@ epics = {
 - Can share canvas via email invite
 - Viewers cannot edit
 - Offline mode: localStorage fallback with sync on reconnect
-""",
-        "epic", "phase-1"
-    ),
-    
-    2: create_epic(
-        "🎯 Epic: Phase 2 - Real-Time Collaboration MVP",
-        """# Phase 2: Real-Time Collaboration MVP
+"""
+
+PHASE2_BODY = """# Phase 2: Real-Time Collaboration MVP
 
 **Goal:** Multiple users editing same canvas simultaneously with presence indicators.
 
@@ -108,13 +68,9 @@ epics = {
 - Cursor positions visible for all collaborators
 - Selection boxes show who has what selected
 - Disconnect/reconnect preserves state
-""",
-        "epic", "phase-2"
-    ),
-    
-    3: create_epic(
-        "🎯 Epic: Phase 3 - Real-Time Polish",
-        """# Phase 3: Real-Time Polish
+"""
+
+PHASE3_BODY = """# Phase 3: Real-Time Polish
 
 **Goal:** Production-quality collaboration with soft locks, conflict UI, and checkpoints.
 
@@ -135,13 +91,9 @@ epics = {
 - Auto-checkpoint every 5 minutes
 - Can restore to any checkpoint
 - 60fps drag with 5 collaborators
-""",
-        "epic", "phase-3"
-    ),
-    
-    4: create_epic(
-        "🎯 Epic: Phase 4 - Agent Branches & Proposals",
-        """# Phase 4: Agent Branches + Proposals
+"""
+
+PHASE4_BODY = """# Phase 4: Agent Branches + Proposals
 
 **Goal:** AI agents can create branches, make changes, submit proposals for human review.
 
@@ -163,13 +115,9 @@ epics = {
 - Rationale visible per-operation
 - Human must approve before merge
 - Merged changes appear in main canvas
-""",
-        "epic", "phase-4"
-    ),
-    
-    5: create_epic(
-        "🎯 Epic: Phase 5 - Export Pipeline",
-        """# Phase 5: Export Pipeline
+"""
+
+PHASE5_BODY = """# Phase 5: Export Pipeline
 
 **Goal:** Export designs to usable formats for building real applications.
 
@@ -189,16 +137,60 @@ epics = {
 - React export produces runnable components
 - Tokens export compatible with style-dictionary
 - Export respects node semantic hints
-""",
-        "epic", "phase-5"
-    ),
-}
-
-print("\n" + "="*60)
-print("✅ Epic issues created!")
-print("="*60)
-print("\nDependency chain:")
-print("  Phase 0 (epic) → Phase 1 (epic) → Phase 2 (epic) → Phase 3 (epic) → Phase 4 (epic)")
-print("                                      ↓")
-print("                              Phase 5 (epic) [parallel]")
-print(f"\nVisit: https://github.com/{REPO}/issues")
+"""
+
+# Pure data: one (title, body, labels) tuple per epic, in dependency order.
+EPICS = [
+    ("🎯 Epic: Phase 0 - Prep & Hardening", PHASE0_BODY, ["epic", "phase-0"]),
+    ("🎯 Epic: Phase 1 - Cloud Persistence & Sharing", PHASE1_BODY, ["epic", "phase-1"]),
+    ("🎯 Epic: Phase 2 - Real-Time Collaboration MVP", PHASE2_BODY, ["epic", "phase-2"]),
+    ("🎯 Epic: Phase 3 - Real-Time Polish", PHASE3_BODY, ["epic", "phase-3"]),
+    ("🎯 Epic: Phase 4 - Agent Branches & Proposals", PHASE4_BODY, ["epic", "phase-4"]),
+    ("🎯 Epic: Phase 5 - Export Pipeline", PHASE5_BODY, ["epic", "phase-5"]),
+]
+
+# Epics queued by create_epic(); submitted in one batched GraphQL request.
+pending = []
+
+def create_epic(title, body, *labels):
+    """Queue an epic for batch creation."""
+    pending.append({"title": title, "body": body, "labels": list(labels)})
+    print(f"  📋 Queued: {title[:40]}")
+
+def main():
+    """Create all epics; returns {phase index: issue number} for created epics."""
+    print("Creating Epic Issues...\n")
+
+    pending.clear()
+    for title, body, labels in EPICS:
+        create_epic(title, body, *labels)
+
+    numbers = {}
+    title_to_phase = {title: i for i, (title, _, _) in enumerate(EPICS)}
+
+    def record(num, epic):
+        numbers[title_to_phase[epic["title"]]] = num
+        print(f"  ✅ Epic #{num}: {epic['title'][:40]}")
+
+    print(f"\nSubmitting {len(pending)} epics in one batched request...")
+    meta, err = fetch_repo_metadata(OWNER, NAME)
+    if err:
+        print(f"  ❌ Could not fetch repo metadata: {err}")
+    else:
+        submit_issues(
+            meta, pending, record,
+            lambda e: print(f"  ❌ Batch create failed: {e}"),
+        )
+
+    print("\n" + "="*60)
+    print("✅ Epic issues created!")
+    print("="*60)
+    print("\nDependency chain:")
+    print("  Phase 0 (epic) → Phase 1 (epic) → Phase 2 (epic) → Phase 3 (epic) → Phase 4 (epic)")
+    print("                                      ↓")
+    print("                              Phase 5 (epic) [parallel]")
+    print(f"\nVisit: https://github.com/{REPO}/issues")
+    return numbers
+
+if __name__ == "__main__":
+    main()
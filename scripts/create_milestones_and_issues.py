@@ -1,716 +1,127 @@
 #!/usr/bin/env python3
 """
-Script to create GitHub milestones and issues using GitHub CLI
+Script to create GitHub milestones and issues using the GitHub REST API
 """
 
-import json
+import argparse
+import asyncio
+import re
 import subprocess
+from pathlib import Path
 from typing import Optional
 
-REPO_OWNER = "goblinsan"
-REPO_NAME = "vizail"
-
-# Phase data extracted from COLLABORATION_ROADMAP.md
-PHASES = {
-    "Phase 0: Prep & Hardening": {
-        "description": "Stabilize codebase, improve type safety, add telemetry, prepare for cloud migration.",
-        "duration": "2-3 weeks",
-        "issues": [
-            {
-                "title": "Complete Command Pattern Integration",
-                "body": """## Description
-Audit all `setSpec` calls in CanvasStage.tsx and ensure all mutations go through the command system.
-
-## Tasks
-- Audit all `setSpec` calls in CanvasStage.tsx
-- Route transform operations through `createTransformNodesCommand`
-- Route property updates through `createUpdateNodePropsCommand`
-- Ensure all paths use `setSpec` wrapper with history tracking
-- Add tests for any newly routed commands
-
-## Acceptance Criteria
-- All spec mutations go through command system
-- New tests added for routed commands
-- No behavior changes to user-facing functionality
-
-## Labels
-enhancement, tech-debt, priority-high""",
-            },
-            {
-                "title": "Add Schema Versioning & Migration",
-                "body": """## Description
-Add version field to LayoutSpec and create migration infrastructure for future schema changes.
-
-## Tasks
-- Add `version: number` field to LayoutSpec interface
-- Create `src/utils/migration.ts` with `migrateSpec()` function
-- Handle missing version (assume v0)
-- Add migration test cases for future schema changes
-- Update useDesignPersistence to call migration on load
-
-## Acceptance Criteria
-- LayoutSpec has `version` field with migration path
-- New localStorage data loads without migration needed
-- Old data can be migrated forward
-
-## Labels
-enhancement, data-integrity""",
-            },
-            {
-                "title": "Add Error Boundary & Telemetry",
-                "body": """## Description
-Add error boundary around canvas and basic telemetry hook for observability.
-
-## Tasks
-- Create ErrorBoundary component wrapping CanvasStage
-- Show friendly error UI with "Reset" option
-- Create useTelemetry hook (stub implementation)
-- Log: canvas-load, node-create, node-delete, error events
-- Add to CanvasApp component tree
-
-## Acceptance Criteria
-- App gracefully handles canvas errors
-- Telemetry hook integrated in key paths
-- Users can recover from errors
-
-## Labels
-enhancement, reliability""",
-            },
-            {
-                "title": "Lint & Type Safety Pass",
-                "body": """## Description
-Eliminate remaining `any` types and improve type safety across the codebase.
-
-## Tasks
-- Run `lint:strict` and fix all errors
-- Eliminate remaining `any` types in commands/
-- Add explicit return types to all public functions
-- Document any intentional `any` with `// eslint-disable-next-line`
-
-## Acceptance Criteria
-- All errors pass `STRICT_TYPES=1` linting
-- No new `any` types introduced without documentation
-
-## Labels
-tech-debt, types""",
-            },
-        ],
-    },
-    "Phase 1: Cloud Persistence + Sharing": {
-        "description": "Replace localStorage with cloud storage, enable canvas sharing with basic roles.",
-        "duration": "3-4 weeks",
-        "issues": [
-            {
-                "title": "Set Up Cloudflare Infrastructure",
-                "body": """## Description
-Initialize Cloudflare Pages and Workers infrastructure for cloud deployment.
-
-## Tasks
-- Create Pages project for frontend
-- Create Worker project for API (`workers/api/`)
-- Set up D1 database with schema
-- Configure wrangler.toml for dev/staging/prod
-- Set up GitHub Actions for deployment
-- Document local dev setup in README
-
-## Acceptance Criteria
-- App deployable to Cloudflare Pages
-- Worker project scaffolded and configured
-- D1 database created with tables
-- Deployment automated via GitHub Actions
-
-## Labels
-infrastructure, priority-high""",
-            },
-            {
-                "title": "Implement Canvas CRUD API",
-                "body": """## Description
-Build REST API endpoints for canvas management (create, read, update, delete).
-
-## Endpoints
-- POST /api/canvases - Create canvas
-- GET /api/canvases - List user's canvases
-- GET /api/canvases/:id - Get canvas (metadata + snapshot)
-- PUT /api/canvases/:id - Update metadata
-- DELETE /api/canvases/:id - Delete canvas
-
-## Tasks
-- Implement all CRUD endpoints in Worker
-- Add input validation with Zod
-- Add error handling middleware
-- Add unit tests for each endpoint
-- Document API with examples
-
-## Acceptance Criteria
-- All endpoints implemented and tested
-- Input validation prevents invalid data
-- Proper HTTP status codes returned
-- Error messages clear and actionable
-
-## Labels
-api, priority-high""",
-            },
-            {
-                "title": "Create useCloudPersistence Hook",
-                "body": """## Description
-Build drop-in replacement for useDesignPersistence that syncs with cloud backend.
-
-## Tasks
-- Create useCloudPersistence hook
-- Fetch canvas on mount, autosave on change (debounced)
-- Handle 401/403 errors with retry logic
-- Implement offline detection with localStorage fallback
-- Sync on reconnect
-- Add loading/saving states
-
-## Acceptance Criteria
-- Existing app works identically with cloud backend
-- Can save/load canvases from cloud
-- Offline mode works with sync on reconnect
-- Loading states visible to user
-
-## Labels
-frontend, priority-high""",
-            },
-            {
-                "title": "Implement Sharing & Memberships",
-                "body": """## Description
-Add ability to share canvases with other users with role-based access control.
-
-## Endpoints
-- POST /api/canvases/:id/members - Add collaborator
-- GET /api/canvases/:id/members - List collaborators
-- DELETE /api/canvases/:id/members/:uid - Remove collaborator
-- POST /api/canvases/:id/invite-link - Generate invite link
-
-## Tasks
-- Build ShareDialog component (email input)
-- Implement membership endpoints
-- Add role selection (editor/viewer)
-- Add role checks to API
-- Implement role enforcement in permissions
-
-## Acceptance Criteria
-- Users can share canvases via email
-- Viewers cannot edit shared canvases
-- Owners can manage collaborators
-- Invite links work correctly
-
-## Labels
-api, frontend""",
-            },
-            {
-                "title": "Add Cloudflare Access Integration",
-                "body": """## Description
-Implement authentication via Cloudflare Access for Phase 1 (friends-only mode).
-
-## Tasks
-- Configure Access application for app domain
-- Parse CF-Access-JWT-Assertion header in Worker
-- Extract user email for identity
-- Create/find user in D1 on first access
-- Handle Access allowlist management
-
-## Acceptance Criteria
-- Only allowlisted users can access app
-- User identity extracted from Access token
-- User profile created/updated automatically
-
-## Labels
-auth, infrastructure""",
-            },
-        ],
-    },
-    "Phase 2: Real-Time Collaboration MVP": {
-        "description": "Multiple users editing same canvas simultaneously with presence indicators.",
-        "duration": "4-5 weeks",
-        "issues": [
-            {
-                "title": "Set Up Yjs + Durable Objects",
-                "body": """## Description
-Initialize Yjs CRDT library and create Durable Object infrastructure for realtime rooms.
-
-## Tasks
-- Add yjs, y-websocket dependencies
-- Create Durable Object class CanvasRoom
-- Implement WebSocket upgrade handling
-- Store Yjs doc state in DO storage
-- Handle join/leave/update messages
-- Add connection heartbeat/ping-pong
+import httpx
 
-## Acceptance Criteria
-- Yjs integrated with proper types
-- Durable Objects can store canvas state
-- WebSocket connections work reliably
-- State persists across reconnects
-
-## Labels
-infrastructure, realtime, priority-high""",
-            },
-            {
-                "title": "Create Yjs-LayoutSpec Conversion Layer",
-                "body": """## Description
-Build conversion functions between LayoutSpec and Yjs document structures.
-
-## Tasks
-- Implement YjsCanvasDoc wrapper class
-- Create layoutSpecToYjs(spec, ydoc) function
-- Create yjsToLayoutSpec(ydoc) function
-- Handle all node types correctly
-- Preserve z-order via Y.Array
-- Add comprehensive unit tests
-
-## Acceptance Criteria
-- Conversion functions handle all node types
-- Round-trip conversion is lossless
-- Z-order preserved correctly
-- All tests passing
-
-## Labels
-realtime, data""",
-            },
-            {
-                "title": "Build useRealtimeCanvas Hook",
-                "body": """## Description
-Create React hook for managing realtime canvas connections and state sync.
-
-## Tasks
-- Implement WebSocket connection management
-- Sync Yjs doc with provider
-- Integrate awareness protocol
-- Implement reconnect with exponential backoff
-- Handle state merging on reconnect
-- Expose API: spec, setSpec (optimistic), presence
-
-## Acceptance Criteria
-- Hook provides seamless realtime experience
-- Automatic reconnect works smoothly
-- State consistent across clients
-- No data loss on network issues
-
-## Labels
-frontend, realtime""",
-            },
-            {
-                "title": "Implement Presence UI",
-                "body": """## Description
-Build visual indicators showing other users' cursors and selections.
-
-## Tasks
-- Create cursor overlay component
-- Create selection box overlay component
-- Build user list sidebar showing who's online
-- Assign distinct colors to each user
-- Show user avatars and names
-- Update presence in real-time
-
-## Acceptance Criteria
-- Other users' cursors visible
-- Other users' selections visible
-- User list shows active collaborators
-- Colors assigned consistently
-
-## Labels
-frontend, realtime""",
-            },
-            {
-                "title": "Add Connection Status Indicator",
-                "body": """## Description
-Display connection status and sync indicators to users.
-
-## Tasks
-- Show connected/connecting/disconnected states
-- Add retry button for manual reconnect
-- Show offline mode indicator
-- Display sync status (saving/saved/error)
-- Add helpful error messages
-
-## Acceptance Criteria
-- Users know connection state at all times
-- Offline mode clearly indicated
-- Errors are actionable
-
-## Labels
-frontend, ux""",
-            },
-        ],
-    },
-    "Phase 3: Real-Time Polish": {
-        "description": "Production-quality collaboration with soft locks, conflict UI, and checkpoints.",
-        "duration": "2-3 weeks",
-        "issues": [
-            {
-                "title": "Implement Soft Locks",
-                "body": """## Description
-Add soft lock system to prevent conflicts during drag/resize operations.
-
-## Tasks
-- Track dragging state in awareness
-- Show lock icon on nodes being dragged
-- Prevent selection of locked nodes (with toast)
-- Show ghost position preview for locked drags
-- Release lock on drag end
-- Handle lock timeout on disconnect
-
-## Acceptance Criteria
-- Dragging node shows lock to others
-- Locked nodes cannot be selected
-- Locks release properly on drag end
-- No stuck locks from crashed clients
-
-## Labels
-realtime, ux""",
-            },
-            {
-                "title": "Add Conflict Notifications",
-                "body": """## Description
-Show non-blocking notifications when remote changes affect selected nodes.
-
-## Tasks
-- Detect when remote change affects selection
-- Show non-blocking toast notification
-- Display conflicting user's name and action
-- Option to undo local pending changes
-- Auto-dismiss after timeout
-
-## Acceptance Criteria
-- Conflicts detected accurately
-- Notifications non-blocking and helpful
-- Users can recover from conflicts easily
-
-## Labels
-realtime, ux""",
-            },
-            {
-                "title": "Implement Checkpoint System",
-                "body": """## Description
-Add ability to create and restore snapshots of canvas state.
-
-## Endpoints
-- POST /api/canvases/:id/checkpoints - Manual checkpoint
-- GET /api/canvases/:id/checkpoints - List checkpoints
-- POST /api/checkpoints/:id/restore - Restore from checkpoint
-
-## Tasks
-- Implement auto-checkpoint every 5 min
-- Create manual checkpoint endpoint
-- Store Yjs state in R2
-- Build checkpoint list/restore UI
-- Add checkpoint labels and descriptions
-- Implement garbage collection (keep last 50)
-
-## Acceptance Criteria
-- Auto-checkpoints created reliably
-- Manual checkpoints can be created
-- Restore works without data loss
-- Old checkpoints cleaned up
-
-## Labels
-api, data-integrity""",
-            },
-            {
-                "title": "Real-Time Performance Optimization",
-                "body": """## Description
-Optimize performance for multi-user editing scenarios.
-
-## Tasks
-- Batch Yjs updates during drag (debounce)
-- Throttle remote presence updates (10fps max)
-- Optimize re-renders on spec change
-- Profile and fix bottlenecks with React DevTools
-- Load test with 5+ concurrent users
-- Target: 60fps drag with 5 collaborators
-
-## Acceptance Criteria
-- Drag maintains 60fps with 5 users
-- Presence updates throttled appropriately
-- No unnecessary re-renders
-- CPU usage acceptable
-
-## Labels
-performance, realtime""",
-            },
-        ],
-    },
-    "Phase 4: Agent Branches + Proposals": {
-        "description": "AI agents can create branches, make changes, and submit proposals for human review.",
-        "duration": "4-5 weeks",
-        "issues": [
-            {
-                "title": "Implement Agent Branch System",
-                "body": """## Description
-Enable agents to fork canvases into isolated branches for experimentation.
-
-## Endpoints
-- POST /api/canvases/:id/branches - Create branch
-- GET /api/canvases/:id/branches - List branches
-- GET /api/branches/:id - Get branch details
-- DELETE /api/branches/:id - Delete branch
-
-## Tasks
-- Implement branch CRUD endpoints
-- Store base version + Yjs state for each branch
-- Allow agents to edit branch independently
-- Implement garbage collection (7 day expiry)
-- Add branch status tracking
-
-## Acceptance Criteria
-- Agents can fork canvases to branches
-- Branch edits don't affect main canvas
-- Branches can be listed and deleted
-
-## Labels
-api, agents""",
-            },
-            {
-                "title": "Build Proposal Submission Flow",
-                "body": """## Description
-Allow agents to submit proposals for merging changes back to main canvas.
-
-## Endpoints
-- POST /api/branches/:id/proposals - Submit proposal
-- GET /api/canvases/:id/proposals - List proposals
-- GET /api/proposals/:id - Get proposal details
-
-## Tasks
-- Capture operations, rationale, assumptions, confidence
-- Generate preview image (render canvas to image)
-- Store in D1 with pending status
-- Notify canvas owner via webhook/email
-- Track proposal history
-
-## Acceptance Criteria
-- Agents can submit proposals
-- Proposals include clear rationale
-- Canvas owners are notified
-- Proposal history maintained
-
-## Labels
-api, agents""",
-            },
-            {
-                "title": "Create Proposal Review UI",
-                "body": """## Description
-Build interface for reviewing and managing agent proposals.
-
-## Tasks
-- Build ProposalListPanel component
-- Implement ProposalDiffView with visual diff
-- Show rationale and assumptions
-- Add approve/reject buttons
-- Implement merge operation on approve
-- Show approval history
+from _gh import _dumps, _loads, api_request
 
-## Acceptance Criteria
-- Proposals listed with status
-- Diff clearly shows changes
-- Approve/reject workflows working
-- Changes merged correctly
-
-## Labels
-frontend, agents""",
-            },
-            {
-                "title": "Add Design Rationale Layer",
-                "body": """## Description
-Store and display AI reasoning for proposed changes.
-
-## Tasks
-- Store rationale in Yjs meta map (keyed by node ID)
-- Create RationaleTooltip component
-- Show "AI suggested" badge on nodes from proposals
-- View full rationale on hover/click
-- Display assumptions and confidence score
-
-## Acceptance Criteria
-- Rationale visible in canvas
-- Tooltips show full AI reasoning
-- Confidence scores displayed
-- Works across proposal merges
-
-## Labels
-frontend, agents""",
-            },
-            {
-                "title": "Agent Token Management",
-                "body": """## Description
-Implement secure token generation for agent authentication.
-
-## Endpoints
-- POST /api/canvases/:id/agent-token - Generate token
-- GET /api/agents/tokens - List agent tokens
-- DELETE /api/agents/tokens/:id - Revoke token
-
-## Tasks
-- Generate JWT tokens with scope/expiry
-- Build AgentTokenDialog UI component
-- Token includes: scope, expiry, canvasId
-- Implement token validation in Worker
-- Rate limit tokens separately from users
-- Token revocation working
-
-## Acceptance Criteria
-- Tokens generated securely
-- Tokens include appropriate scopes
-- Revocation works immediately
-- Rate limits prevent abuse
-
-## Labels
-auth, agents""",
-            },
-        ],
-    },
-    "Phase 5: Export Pipeline": {
-        "description": "Export designs to usable formats for building real applications.",
-        "duration": "2-3 weeks",
-        "issues": [
-            {
-                "title": "Implement JSON Canonical Export",
-                "body": """## Description
-Create stable JSON export format for LayoutSpec designs.
-
-## Endpoints
-- POST /api/canvases/:id/export/json
-
-## Tasks
-- Define stable export JSON schema with version
-- Include metadata (exportedAt, author, title)
-- Validate lossless round-trip conversion
-- Add export tests
-- Document schema
+REPO_OWNER = "goblinsan"
+REPO_NAME = "vizail"
+REPO_PATH = f"/repos/{REPO_OWNER}/{REPO_NAME}"
+
+# Resolve the auth token once; every request multiplexes over the async
+# client's HTTP/2 connection instead of forking a gh subprocess per call.
+TOKEN = subprocess.check_output(["gh", "auth", "token"], text=True).strip()
+API_HEADERS = {
+    "Authorization": f"Bearer {TOKEN}",
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
 
-## Acceptance Criteria
-- JSON export is lossless
-- Round-trip conversion works
-- Schema versioned for future changes
-
-## Labels
-export, api""",
-            },
-            {
-                "title": "Build React + Tailwind Exporter",
-                "body": """## Description
-Generate runnable React components with Tailwind CSS from designs.
-
-## Endpoints
-- POST /api/canvases/:id/export/react
-
-## Tasks
-- Map LayoutSpec nodes to React components
-- Generate Tailwind classes for styles
-- Handle nested structures
-- Output: zip with components + index + package.json
-- Add component composition helpers
+# Phase data (extracted from COLLABORATION_ROADMAP.md) lives in phases.json
+# and is loaded lazily in main(), so partial re-runs don't pay for parsing
+# ~600 lines of literals at import time.
+PHASES_PATH = Path(__file__).with_name("phases.json")
 
-## Acceptance Criteria
-- Exported components are runnable
-- Tailwind classes applied correctly
-- Nested structures handled properly
-- Output is production-ready
-
-## Labels
-export, api""",
-            },
-            {
-                "title": "Create Design Tokens Extractor",
-                "body": """## Description
-Extract design system tokens from designs.
-
-## Endpoints
-- POST /api/canvases/:id/export/tokens
-
-## Tasks
-- Extract: colors, spacing, typography, radii
-- Dedupe and intelligently name tokens
-- Generate style-dictionary compatible format
-- Add documentation for token usage
-- Support multiple output formats
+# Issue bodies end with a "## Labels\nenhancement, tech-debt, …" footer;
+# parse it once per issue and send real labels instead of shipping the
+# footer as prose.
+LABEL_RE = re.compile(r"## Labels\s*\n([^\n]+)")
 
-## Acceptance Criteria
-- Tokens extracted automatically
-- Naming is semantic and consistent
-- Output compatible with style-dictionary
-- Documentation clear
-
-## Labels
-export, api""",
-            },
-            {
-                "title": "Build Export Dialog UI",
-                "body": """## Description
-Create user interface for exporting designs.
-
-## Tasks
-- Build ExportDialog component
-- Format selection (JSON/React/Tokens)
-- Options per format (component wrapping, naming, etc)
-- Download button with progress
-- Preview panel (optional)
-- Export history
+def load_phases() -> dict:
+    return _loads(PHASES_PATH.read_bytes())
 
-## Acceptance Criteria
-- Dialog UX is intuitive
-- All formats exportable
-- Download works reliably
-- Progress visible to user
-
-## Labels
-frontend, export""",
-            },
-        ],
-    },
-}
+async def api_post(client: httpx.AsyncClient, path: str, payload: dict) -> Optional[dict]:
+    """POST to the repo's REST API through the shared client."""
+    try:
+        resp = await api_request(client, "POST", f"{REPO_PATH}{path}", json=payload)
+        if resp.status_code >= 400:
+            print(f"Error from POST {path}: {resp.status_code}")
+            print(f"body: {resp.text}")
+            return None
+        return _loads(resp.content)
+    except Exception as e:
+        print(f"Exception calling POST {path}: {e}")
+        return None
 
-def run_gh_command(cmd: list) -> Optional[str]:
-    """Run a GitHub CLI command and return output."""
+async def api_get_all(client: httpx.AsyncClient, path: str) -> list:
+    """GET every page of a list endpoint, following Link headers."""
+    items = []
+    url = f"{REPO_PATH}{path}"
+    while url:
+        resp = await api_request(client, "GET", url)
+        if resp.status_code >= 400:
+            print(f"Error from GET {path}: {resp.status_code}")
+            break
+        items.extend(_loads(resp.content))
+        url = resp.links.get("next", {}).get("url")
+    return items
+
+async def graphql(client: httpx.AsyncClient, query: str) -> Optional[dict]:
+    """POST one GraphQL document through the shared client; returns data."""
     try:
-        result = subprocess.run(
-            ["gh"] + cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            print(f"Error running command: {' '.join(cmd)}")
-            print(f"stderr: {result.stderr}")
+        resp = await api_request(client, "POST", "/graphql", json={"query": query})
+        if resp.status_code != 200:
+            print(f"Error from GraphQL: {resp.status_code}")
+            print(f"body: {resp.text}")
+            return None
+        payload = _loads(resp.content)
+        if payload.get("errors"):
+            print(f"GraphQL errors: {payload['errors'][0].get('message')}")
             return None
-        return result.stdout.strip()
+        return payload["data"]
     except Exception as e:
-        print(f"Exception running command: {e}")
+        print(f"Exception calling GraphQL: {e}")
+        return None
+
+async def fetch_repository_info(client: httpx.AsyncClient) -> Optional[tuple]:
+    """Fetch the repo node ID and the label name → ID map in one query."""
+    data = await graphql(
+        client,
+        f'query {{ repository(owner: "{REPO_OWNER}", name: "{REPO_NAME}") '
+        "{ id labels(first: 100) { nodes { id name } } } }",
+    )
+    if not data:
         return None
+    repo = data["repository"]
+    return repo["id"], {node["name"]: node["id"] for node in repo["labels"]["nodes"]}
+
+async def create_milestone(client: httpx.AsyncClient, title: str, description: str, duration: str, existing: dict) -> Optional[dict]:
+    """Create a GitHub milestone and return its number and node ID."""
+    if title in existing:
+        print(f"📌 Milestone already exists: {title} (#{existing[title]['number']})")
+        return existing[title]
 
-def create_milestone(title: str, description: str, duration: str) -> Optional[str]:
-    """Create a GitHub milestone and return its number."""
     print(f"📌 Creating milestone: {title}")
-    
-    output = run_gh_command([
-        "milestone",
-        "create",
-        "--repo",
-        REPO,
-        "--title",
-        title,
-        "--description",
-        f"{description}\n\nEstimated Duration: {duration}",
-    ])
-    
-    if output:
-        # Extract milestone number from response
-        # gh returns JSON with "number" field
-        try:
-            result = json.loads(output)
-            milestone_num = result.get("number")
-            print(f"✅ Created milestone #{milestone_num}: {title}")
-            return milestone_num
-        except:
-            print(f"⚠️  Could not parse milestone response: {output}")
-            return None
-    return None
 
-def create_epic(milestone_num: str, title: str) -> Optional[str]:
+    result = await api_post(client, "/milestones", {
+        "title": title,
+        "description": f"{description}\n\nEstimated Duration: {duration}",
+    })
+    if not result:
+        return None
+
+    print(f"✅ Created milestone #{result['number']}: {title}")
+    return {"number": result["number"], "node_id": result["node_id"]}
+
+async def create_epic(client: httpx.AsyncClient, milestone_num: str, title: str, existing: dict) -> Optional[str]:
     """Create an epic (labeled PR) and return its number."""
+    full_title = f"[{milestone_num}] Epic: {title}"
+    if full_title in existing:
+        print(f"  📋 Epic already exists: {title} (#{existing[full_title]})")
+        return existing[full_title]
+
     print(f"  📋 Creating epic: {title}")
-    
+
     body = f"""## Epic Overview
 
 This Epic is part of Milestone: {milestone_num}
@@ -731,102 +142,161 @@ This Epic is part of Milestone: {milestone_num}
 ---
 
 **To link issues to this Epic:**
-Add a comment on the Issue with: `Part of #{issue_number}`
-Or reference in issue body: `Relates to #{issue_number}`
+Add a comment on the Issue with: `Part of #{{issue_number}}`
+Or reference in issue body: `Relates to #{{issue_number}}`
 """
-    
-    output = run_gh_command([
-        "issue",
-        "create",
-        "--repo",
-        REPO,
-        "--title",
-        f"[{milestone_num}] Epic: {title}",
-        "--body",
-        body,
-        "--label",
-        "Epic",
-        "--milestone",
-        str(milestone_num),
-    ])
-    
-    if output:
-        try:
-            result = json.loads(output)
-            epic_num = result.get("number")
-            print(f"✅ Created epic #{epic_num}: {title}")
-            return epic_num
-        except:
-            print(f"⚠️  Could not parse epic response: {output}")
-            return None
-    return None
-
-def create_issue(milestone_num: str, epic_num: str, title: str, body: str) -> Optional[str]:
-    """Create an issue linked to an epic and return its number."""
-    # Add epic reference to body
-    full_body = f"{body}\n\n---\n\nPart of Epic #{epic_num}"
-    
-    output = run_gh_command([
-        "issue",
-        "create",
-        "--repo",
-        REPO,
-        "--title",
-        title,
-        "--body",
-        full_body,
-        "--milestone",
-        str(milestone_num),
-    ])
-    
-    if output:
-        try:
-            result = json.loads(output)
-            issue_num = result.get("number")
-            print(f"✅ Created issue #{issue_num}: {title}")
-            return issue_num
-        except:
-            print(f"⚠️  Could not parse issue response: {output}")
-            return None
-    return None
+
+    result = await api_post(client, "/issues", {
+        "title": full_title,
+        "body": body,
+        "labels": ["Epic"],
+        "milestone": milestone_num,
+    })
+
+    if not result:
+        return None
+
+    print(f"✅ Created epic #{result['number']}: {title}")
+    return result["number"]
+
+async def create_issues_batch(client: httpx.AsyncClient, repo_id: str, milestone_id: str, epic_num: str, issues: list, existing: dict, label_ids: dict) -> None:
+    """Create a phase's issues with a single aliased createIssue mutation."""
+    skipped = [i for i in issues if i["title"] in existing]
+    for issue in skipped:
+        print(f"✅ Issue already exists #{existing[issue['title']]}: {issue['title']}")
+    issues = [i for i in issues if i["title"] not in existing]
+    if not issues:
+        return
+
+    # Everything except the title/body is identical across the batch, so
+    # build the epic suffix and the shared input fields once.
+    epic_suffix = f"\n\n---\n\nPart of Epic #{epic_num}"
+    common = f"repositoryId: {_dumps(repo_id)}, milestoneId: {_dumps(milestone_id)}"
+
+    fields = []
+    for i, issue in enumerate(issues):
+        body = issue["body"]
+        match = LABEL_RE.search(body)
+        labels = []
+        if match:
+            labels = [name.strip() for name in match.group(1).split(",")]
+            body = body[:match.start()].rstrip()
+        for name in labels:
+            if name not in label_ids:
+                print(f"⚠️  Unknown label {name!r} on: {issue['title']}")
+        ids = [label_ids[name] for name in labels if name in label_ids]
+
+        inputs = [
+            common,
+            f"title: {_dumps(issue['title'])}",
+            f"body: {_dumps(body + epic_suffix)}",
+        ]
+        if ids:
+            inputs.append(f"labelIds: {_dumps(ids)}")
+        fields.append(
+            f"m{i}: createIssue(input: {{{', '.join(inputs)}}}) {{ issue {{ number }} }}"
+        )
+
+    data = await graphql(client, "mutation {\n" + "\n".join(fields) + "\n}")
+    if data is None:
+        print("⚠️  Failed to create issues for this phase")
+        return
+
+    for i, issue in enumerate(issues):
+        result = data.get(f"m{i}")
+        if result:
+            print(f"✅ Created issue #{result['issue']['number']}: {issue['title']}")
+        else:
+            print(f"⚠️  Failed to create issue: {issue['title']}")
+
+async def process_phase(client: httpx.AsyncClient, repo_id: str, phase_name: str, phase_data: dict,
+                        existing_milestones: dict, existing_issues: dict, label_ids: dict) -> None:
+    """Run one phase's milestone → epic → issues chain.
+
+    The three steps depend on each other, so they stay sequential within a
+    phase; the phases themselves are gathered concurrently in run().
+    """
+    print(f"\n{phase_name}")
+    print("-" * 60)
+
+    milestone = await create_milestone(
+        client,
+        phase_name,
+        phase_data["description"],
+        phase_data["duration"],
+        existing_milestones,
+    )
+
+    if not milestone:
+        print(f"❌ Failed to create milestone for {phase_name}")
+        return
+
+    epic_num = await create_epic(client, milestone["number"], phase_name.replace("Phase X: ", "").replace("Phase ", ""), existing_issues)
+
+    if not epic_num:
+        print(f"❌ Failed to create epic for {phase_name}")
+        return
+
+    # Create the phase's issues in one batched mutation — one round trip
+    # per phase instead of one per issue.
+    await create_issues_batch(client, repo_id, milestone["node_id"], epic_num, phase_data["issues"], existing_issues, label_ids)
+
+async def run(phases: dict) -> None:
+    async with httpx.AsyncClient(
+        http2=True,
+        base_url="https://api.github.com",
+        headers=API_HEADERS,
+        limits=httpx.Limits(max_connections=16),
+        timeout=30.0,
+    ) as client:
+        info = await fetch_repository_info(client)
+        if not info:
+            print("❌ Could not fetch repository ID")
+            return
+        repo_id, label_ids = info
+
+        # Prefetch everything that already exists, so re-runs (common after a
+        # partial rate-limited failure) skip completed work with O(1) lookups
+        # instead of duplicating it or failing.
+        milestone_items, issue_items = await asyncio.gather(
+            api_get_all(client, "/milestones?state=all&per_page=100"),
+            api_get_all(client, "/issues?state=all&per_page=100"),
+        )
+        existing_milestones = {
+            m["title"]: {"number": m["number"], "node_id": m["node_id"]}
+            for m in milestone_items
+        }
+        existing_issues = {i["title"]: i["number"] for i in issue_items}
+
+        # Phases are independent of each other — gather them so the six
+        # milestone/epic/batch chains overlap on the multiplexed connection.
+        await asyncio.gather(*[
+            process_phase(client, repo_id, phase_name, phase_data,
+                          existing_milestones, existing_issues, label_ids)
+            for phase_name, phase_data in phases.items()
+        ])
 
 def main():
+    parser = argparse.ArgumentParser(description="Create GitHub milestones, epics, and issues")
+    parser.add_argument(
+        "--phase", type=int, action="append",
+        help="only create the given phase number (repeatable)",
+    )
+    args = parser.parse_args()
+
+    phases = load_phases()
+    if args.phase:
+        wanted = {f"Phase {n}:" for n in args.phase}
+        phases = {
+            name: data for name, data in phases.items()
+            if any(name.startswith(p) for p in wanted)
+        }
+
     print("🚀 Creating GitHub Milestones, Epics, and Issues")
     print("=" * 60)
-    
-    for phase_name, phase_data in PHASES.items():
-        print(f"\n{phase_name}")
-        print("-" * 60)
-        
-        # Create milestone
-        milestone_num = create_milestone(
-            phase_name,
-            phase_data["description"],
-            phase_data["duration"],
-        )
-        
-        if not milestone_num:
-            print(f"❌ Failed to create milestone for {phase_name}")
-            continue
-        
-        # Create epic
-        epic_num = create_epic(milestone_num, phase_name.replace("Phase X: ", "").replace("Phase ", ""))
-        
-        if not epic_num:
-            print(f"❌ Failed to create epic for {phase_name}")
-            continue
-        
-        # Create issues
-        for issue in phase_data["issues"]:
-            issue_num = create_issue(
-                milestone_num,
-                epic_num,
-                issue["title"],
-                issue["body"],
-            )
-            if not issue_num:
-                print(f"⚠️  Failed to create issue: {issue['title']}")
-    
+
+    asyncio.run(run(phases))
+
     print("\n" + "=" * 60)
     print("✨ Done! All milestones, epics, and issues created.")
     print("📊 Visit the Issues tab to see your roadmap!")
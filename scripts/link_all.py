@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Link child issues to parent epics in a single pass.
+
+Replaces link_child_to_parent.py (body-prepend PATCH per child) and
+link_issues_graphql.py (addSubIssue mutations), which walked the same
+phase_map back to back and doubled the round trips. One pass now resolves
+the child IDs from a single paginated issue list, then gathers the
+sub-issue POSTs and the per-child body PATCHes concurrently on one
+HTTP/2 connection.
+"""
+import asyncio
+import subprocess
+from pathlib import Path
+
+import httpx
+
+from _gh import _dumps, _loads, api_request
+
+REPO = "goblinsan/vizail"
+OWNER, NAME = REPO.split("/")
+
+# Issue number → numeric ID is immutable for the life of a repo, so cache
+# the map across runs (keyed by repo so forks don't collide).
+CACHE_PATH = Path.home() / ".cache" / "vizail_issue_ids.json"
+
+TOKEN = subprocess.check_output(["gh", "auth", "token"], text=True).strip()
+API_HEADERS = {
+    "Authorization": f"Bearer {TOKEN}",
+    "Accept": "application/vnd.github+json",
+}
+
+# Map: parent epic → child issues
+phase_map = {
+    45: [12, 13, 14, 15],           # Phase 0
+    46: [16, 17, 18, 19, 20],       # Phase 1
+    47: [21, 22, 23, 24, 25],       # Phase 2
+    48: [26, 27, 28, 29],           # Phase 3
+    49: [30, 31, 32, 33, 34],       # Phase 4
+    50: [35, 36, 37, 38],           # Phase 5
+}
+
+def load_cached_ids():
+    try:
+        cache = _loads(CACHE_PATH.read_bytes())
+        # Older cache versions stored GraphQL node IDs (strings); only the
+        # numeric REST IDs are usable for the sub_issues endpoint.
+        return {
+            int(n): i for n, i in cache.get(REPO, {}).items()
+            if isinstance(i, int)
+        }
+    except (OSError, ValueError):
+        return {}
+
+def save_cached_ids(issue_ids):
+    try:
+        cache = _loads(CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+    cache[REPO] = {str(n): i for n, i in issue_ids.items()}
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(_dumps(cache))
+
+async def fetch_issue_ids(client, numbers):
+    """Map issue number → numeric ID from one paginated issue list."""
+    ids = {}
+    url = f"/repos/{REPO}/issues?state=all&per_page=100"
+    while url:
+        resp = await api_request(client, "GET", url)
+        if resp.status_code != 200:
+            print(f"❌ Could not fetch issue IDs: HTTP {resp.status_code}")
+            break
+        for item in _loads(resp.content):
+            if item["number"] in numbers:
+                ids[item["number"]] = item["id"]
+        url = resp.links.get("next", {}).get("url")
+    return ids
+
+async def link_sub_issue(client, issue_ids, epic_num, child_num):
+    """Attach one child to its parent epic via the REST sub_issues endpoint."""
+    child_id = issue_ids.get(child_num)
+    if not child_id:
+        print(f"  ❌ Could not get ID for issue #{child_num}")
+        return
+    resp = await api_request(
+        client,
+        "POST",
+        f"/repos/{REPO}/issues/{epic_num}/sub_issues",
+        json={"sub_issue_id": child_id, "replace_parent": True},
+    )
+    if resp.status_code in (200, 201):
+        print(f"  ✅ Linked #{child_num} → #{epic_num}")
+    else:
+        print(f"  ❌ ERROR linking #{child_num}: {resp.text[:100]}")
+
+async def prepend_parent_ref(client, epic_num, issue_num):
+    """Prepend the parent-epic reference to one issue body (GET + PATCH)."""
+    url = f"/repos/{REPO}/issues/{issue_num}"
+    resp = await api_request(client, "GET", url)
+    if resp.status_code != 200:
+        print(f"  ERROR reading #{issue_num}: {resp.status_code}")
+        return
+    body = _loads(resp.content).get("body") or ""
+
+    marker = f"**Parent Epic:** #{epic_num}"
+    if body.startswith(marker):
+        # Already annotated by a previous run — don't stack another prefix
+        # or burn a PATCH on a no-op.
+        print(f"  Body of #{issue_num} already up to date")
+        return
+
+    new_body = f"{marker}\n\n{body}"
+    resp = await api_request(client, "PATCH", url, json={"body": new_body})
+    if resp.status_code == 200:
+        print(f"  Updated body of #{issue_num}")
+    else:
+        print(f"  ERROR updating #{issue_num}: {resp.text[:100]}")
+
+async def main():
+    async with httpx.AsyncClient(
+        http2=True,
+        base_url="https://api.github.com",
+        headers=API_HEADERS,
+        limits=httpx.Limits(max_connections=16),
+        timeout=30.0,
+    ) as client:
+        print("Fetching issue IDs...\n")
+        child_numbers = {child for children in phase_map.values() for child in children}
+        issue_ids = load_cached_ids()
+        missing = child_numbers - set(issue_ids)
+        if missing:
+            issue_ids.update(await fetch_issue_ids(client, missing))
+            save_cached_ids(issue_ids)
+
+        pairs = [(epic, child) for epic, children in phase_map.items() for child in children]
+        print(f"Linking {len(pairs)} child issues to parent epics...\n")
+
+        # The sub-issue links and the body updates touch independent fields,
+        # so all the POSTs and PATCHes run together.
+        await asyncio.gather(
+            *[link_sub_issue(client, issue_ids, epic, child) for epic, child in pairs],
+            *[prepend_parent_ref(client, epic, child) for epic, child in pairs],
+        )
+
+    print("\n✅ All child issues linked to parent epics!")
+
+if __name__ == "__main__":
+    asyncio.run(main())
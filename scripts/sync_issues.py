@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Sync issue bodies and parent-epic links in one pass.
+
+Replaces populate_issue_descriptions.py and link_issues_hierarchy.py,
+which made two separate passes over the same issues (one PATCH for the
+body, one for the parent link). Each issue now rides a fused pair of
+aliased updateIssue + addSubIssue mutations, batched 10 issues per
+GraphQL document, so one HTTPS round trip replaces two per issue.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import select
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from _gh import RateLimiter
+
+REPO = "goblinsan/vizail"
+OWNER, NAME = REPO.split("/")
+GRAPHQL_URL = "/graphql"
+
+# Each issue contributes two aliased mutations, so 10 issues per document
+# stays well under GraphQL node limits.
+CHUNK_SIZE = 10
+MAX_WORKERS = 8
+MAX_RETRIES = 3
+GH_INFLIGHT = 8   # concurrent gh subprocesses on the no-deps fallback path
+
+# Resolve the auth token once; every request multiplexes over one HTTP/2
+# connection, so a whole run pays for a single TLS handshake. Without httpx
+# installed the script falls back to fanned-out gh subprocesses.
+TOKEN = subprocess.check_output(["gh", "auth", "token"], text=True).strip()
+if httpx is not None:
+    session = httpx.Client(
+        http2=True,
+        base_url="https://api.github.com",
+        headers={
+            "Authorization": f"Bearer {TOKEN}",
+            "Accept": "application/vnd.github+json",
+        },
+        timeout=30.0,
+    )
+else:
+    session = None
+
+# Map: parent epic → child issues
+phase_map = {
+    45: [12, 13, 14, 15],           # Phase 0
+    46: [16, 17, 18, 19, 20],       # Phase 1
+    47: [21, 22, 23, 24, 25],       # Phase 2
+    48: [26, 27, 28, 29],           # Phase 3
+    49: [30, 31, 32, 33, 34],       # Phase 4
+    50: [35, 36, 37, 38],           # Phase 5
+}
+PARENT_OF = {child: epic for epic, children in phase_map.items() for child in children}
+
+# Errors go through logging with lazy %-formatting, so the slices and
+# f-strings only materialize when an error branch actually fires.
+logging.basicConfig(format="%(levelname)s %(message)s")
+logger = logging.getLogger("sync_issues")
+
+# Issue bodies (from COLLABORATION_ROADMAP.md) live as one markdown file per
+# issue in issue_bodies/; only the issues actually synced get read, so a
+# --only run never loads the other 26 bodies.
+BODIES_DIR = Path(__file__).with_name("issue_bodies")
+ISSUE_BODIES = {int(p.stem): p for p in BODIES_DIR.glob("*.md")}
+
+# Completed issue numbers persist across runs, so a crash mid-run only
+# costs the issues that hadn't finished yet. Delete the file to force a
+# full re-sync.
+STATE_PATH = Path(__file__).with_name(".populate_state.json")
+_state_lock = threading.Lock()
+
+def load_completed():
+    try:
+        return set(json.loads(STATE_PATH.read_text()).get("done", []))
+    except (OSError, ValueError):
+        return set()
+
+def mark_completed(numbers):
+    """Persist newly completed issues; one write per finished batch."""
+    with _state_lock:
+        done = load_completed()
+        done.update(numbers)
+        STATE_PATH.write_text(json.dumps({"done": sorted(done)}))
+
+class RateLimitError(Exception):
+    """Raised when GitHub keeps rate-limiting after all retries."""
+
+# One limiter shared by every worker thread, so a fan-out pauses as a group
+# when the remaining quota runs low instead of cascading into 403s.
+rate_limiter = RateLimiter()
+
+def send_with_retry(method, url, **kwargs):
+    """Send one request, backing off on transient and rate-limit errors.
+
+    Raises RateLimitError only when the final failure really was a rate
+    limit; a plain 5xx that outlives the retries is returned as-is so the
+    caller reports the actual HTTP status.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        rate_limiter.acquire()
+        resp = session.request(method, url, **kwargs)
+        rate_limiter.update(resp.headers)
+        rate_limited = resp.status_code == 429 or (
+            resp.status_code == 403 and "rate limit" in resp.text.lower()
+        )
+        if not rate_limited and resp.status_code not in {502, 503, 504}:
+            return resp
+        reset = int(resp.headers.get("X-RateLimit-Reset", 0))
+        if attempt == MAX_RETRIES:
+            break
+        wait = max(reset - time.time(), 2 ** attempt)
+        if resp.status_code == 403 and int(resp.headers.get("X-RateLimit-Remaining", 0)) > 0:
+            # 403 with quota remaining is the secondary abuse limit — give it
+            # extra slack and pause the other workers too.
+            wait += 10
+            rate_limiter.update(resp.headers, penalty=wait)
+        logger.warning("HTTP %s; retrying in %.0fs", resp.status_code, wait)
+        time.sleep(wait)
+    if not rate_limited:
+        return resp
+    minutes = max(1, round((reset - time.time()) / 60)) if reset else 1
+    raise RateLimitError(f"GitHub rate limit exceeded; try again in {minutes} minute(s)")
+
+def graphql(query):
+    """POST one GraphQL document; returns (data, error)."""
+    resp = send_with_retry("POST", GRAPHQL_URL, json={"query": query})
+    if resp.status_code != 200:
+        return None, f"HTTP {resp.status_code}: {resp.text[:100]}"
+    payload = resp.json()
+    if payload.get("errors"):
+        return None, payload["errors"][0].get("message", "unknown GraphQL error")
+    return payload["data"], None
+
+def fetch_issues(numbers):
+    """Get node ID, current body, and current parent for every issue in one
+    aliased query."""
+    fields = "\n".join(
+        f"i{n}: issue(number: {n}) {{ id body parent {{ number }} }}"
+        for n in sorted(numbers)
+    )
+    query = f"""
+    query {{
+      repository(owner: "{OWNER}", name: "{NAME}") {{
+        {fields}
+      }}
+    }}
+    """
+    data, err = graphql(query)
+    if err:
+        logger.error("could not fetch issue IDs: %.100s", err)
+        return {}
+    repo = data["repository"]
+    return {n: repo[f"i{n}"] for n in numbers if repo.get(f"i{n}")}
+
+def _digest(text):
+    return hashlib.sha256(text.encode()).digest()
+
+def sync_batch(issue_ids, numbers):
+    """Update bodies and parent links for a chunk in one fused mutation."""
+    fields = []
+    for num in numbers:
+        body = ISSUE_BODIES[num].read_text()
+        body_input = f"id: {json.dumps(issue_ids[num])}, body: {json.dumps(body)}"
+        fields.append(
+            f"m{num}: updateIssue(input: {{{body_input}}}) {{ issue {{ number }} }}"
+        )
+        parent_id = issue_ids.get(PARENT_OF[num])
+        if parent_id:
+            link_input = (
+                f"issueId: {json.dumps(parent_id)}, "
+                f"subIssueId: {json.dumps(issue_ids[num])}, replaceParent: true"
+            )
+            fields.append(
+                f"p{num}: addSubIssue(input: {{{link_input}}}) {{ subIssue {{ number }} }}"
+            )
+
+    data, err = graphql("mutation {\n" + "\n".join(fields) + "\n}")
+    if err:
+        logger.error("error syncing batch: %.100s", err)
+        return
+
+    # Buffer the batch's progress lines and flush them in one write, so the
+    # worker threads don't interleave on (and serialize behind) stdout.
+    lines = []
+    completed = []
+    for num in numbers:
+        body_ok = bool(data.get(f"m{num}"))
+        link_ok = bool(data.get(f"p{num}"))
+        if body_ok and link_ok:
+            lines.append(f"✅ Synced #{num} (body + parent #{PARENT_OF[num]})")
+            completed.append(num)
+        elif body_ok:
+            lines.append(f"⚠️  Updated body of #{num} but failed to link parent")
+        else:
+            lines.append(f"❌ Error syncing #{num}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    if completed:
+        mark_completed(completed)
+
+def spawn_gh_sync(num):
+    """Start one gh PATCH setting the body and parent link together.
+
+    The multi-KB markdown body rides a JSON blob on stdin (--input -)
+    rather than argv, which avoids E2BIG on long bodies, shell-metachar
+    escaping, and gh's field-to-JSON transcoding of -f values.
+    """
+    parent_url = f"https://api.github.com/repos/{REPO}/issues/{PARENT_OF[num]}"
+    payload = json.dumps({
+        "body": ISSUE_BODIES[num].read_text(),
+        "parent_issue_url": parent_url,
+    })
+    proc = subprocess.Popen(
+        ["gh", "api", f"/repos/{REPO}/issues/{num}", "-X", "PATCH", "--input", "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    proc.stdin.write(payload)
+    proc.stdin.close()
+    # communicate() in the reap loop flushes stdin; clear it so it doesn't
+    # trip over the handle we just closed.
+    proc.stdin = None
+    return proc
+
+def sync_with_gh(numbers):
+    """No-deps fallback: fan gh subprocesses out and reap with select.
+
+    subprocess.run would serialize each PATCH behind a full fork/exec plus
+    round trip. Keeping up to GH_INFLIGHT children in flight and reaping
+    whichever finishes first gets the same overlap as the HTTP path while
+    leaning on gh's own auth pipeline.
+    """
+    queue = deque(numbers)
+    inflight = {}
+    while queue or inflight:
+        while queue and len(inflight) < GH_INFLIGHT:
+            num = queue.popleft()
+            proc = spawn_gh_sync(num)
+            inflight[proc.stdout] = (proc, num)
+        ready, _, _ = select.select(list(inflight), [], [], 0.1)
+        results = []
+        completed = []
+        for stream in ready:
+            proc, num = inflight.pop(stream)
+            _, err = proc.communicate()
+            if proc.returncode == 0:
+                results.append(f"✅ Synced #{num} (body + parent #{PARENT_OF[num]})")
+                completed.append(num)
+            else:
+                logger.error("error syncing #%s: %.100s", num, err)
+        if results:
+            sys.stdout.write("\n".join(results) + "\n")
+            sys.stdout.flush()
+        if completed:
+            mark_completed(completed)
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync issue bodies and parent-epic links")
+    parser.add_argument(
+        "--only", type=int, action="append",
+        help="sync only the given issue number (repeatable)",
+    )
+    parser.add_argument(
+        "--since", type=int,
+        help="sync only issues numbered >= N",
+    )
+    args = parser.parse_args()
+
+    all_numbers = sorted(ISSUE_BODIES)
+    if args.only:
+        all_numbers = [n for n in all_numbers if n in set(args.only)]
+    if args.since:
+        all_numbers = [n for n in all_numbers if n >= args.since]
+
+    done = load_completed()
+    if done:
+        resumed = [n for n in all_numbers if n in done]
+        if resumed:
+            print(f"⏭️  {len(resumed)} issue(s) already completed (delete {STATE_PATH.name} to redo)")
+        all_numbers = [n for n in all_numbers if n not in done]
+
+    print("Syncing issue bodies and parent-epic links...\n")
+    if session is None:
+        sync_with_gh(all_numbers)
+    else:
+        # The prefetch goes through send_with_retry too, so the whole branch
+        # sits under the RateLimitError handler — a limit hit while fetching
+        # IDs reports the same "try again in N minute(s)" as one mid-sync.
+        try:
+            issues = fetch_issues(sorted(set(all_numbers) | set(phase_map)))
+            issue_ids = {n: info["id"] for n, info in issues.items()}
+            work = [n for n in all_numbers if n in issue_ids]
+            # Skip issues whose body AND parent link are already current — no
+            # point burning rate limit re-sending identical mutations; a typical
+            # re-run drops from 27 mutations to the one or two that actually
+            # changed. The link check matters: a batch that updated the body but
+            # failed addSubIssue must stay in the work list or the link could
+            # never be repaired by re-running.
+            current = [
+                n for n in work
+                if _digest(ISSUE_BODIES[n].read_text()) == _digest(issues[n].get("body") or "")
+                and (issues[n].get("parent") or {}).get("number") == PARENT_OF[n]
+            ]
+            if current:
+                print(f"⏭️  {len(current)} issue(s) already up to date")
+                work = [n for n in work if n not in set(current)]
+            chunks = [work[i:i + CHUNK_SIZE] for i in range(0, len(work), CHUNK_SIZE)]
+            # The chunks are independent mutations, so fan them out across workers on
+            # the shared session's warm connection pool.
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                list(ex.map(partial(sync_batch, issue_ids), chunks))
+        except RateLimitError as e:
+            logger.error("%s", e)
+
+    print("\n✅ All issues synced!")
+
+if __name__ == "__main__":
+    main()